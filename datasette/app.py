@@ -269,6 +269,7 @@ class Datasette:
         self.config_dir = config_dir
         self.pdb = pdb
         self._secret = secret or secrets.token_hex(32)
+        self._serializers = {}
         if files is not None and isinstance(files, str):
             raise ValueError("files= must be a list of paths, not a string")
         self.files = tuple(files or []) + tuple(immutables or [])
@@ -292,6 +293,7 @@ class Datasette:
         self.immutables = set(immutables or [])
         self.databases = collections.OrderedDict()
         self.permissions = {}  # .invoke_startup() will populate this
+        self._permission_abbrs = {}  # Permission name -> abbr, or name if no abbr
         try:
             self._refresh_schemas_lock = asyncio.Lock()
         except RuntimeError as rex:
@@ -440,6 +442,9 @@ class Datasette:
         environment.filters["to_css_class"] = to_css_class
         self._register_renderers()
         self._permission_checks = collections.deque(maxlen=200)
+        # Recently checked signed API tokens, see default_permissions.py
+        self._signed_token_cache = collections.OrderedDict()
+        self._rejected_token_cache = collections.OrderedDict()
         self._root_token = secrets.token_hex(32)
         self.client = DatasetteClient(self)
 
@@ -570,6 +575,7 @@ class Datasette:
                     if p.abbr:
                         abbrs[p.abbr] = p
                     self.permissions[p.name] = p
+                    self._permission_abbrs[p.name] = p.abbr or p.name
         for hook in pm.hook.prepare_jinja2_environment(
             env=self._jinja_env, datasette=self
         ):
@@ -578,11 +584,19 @@ class Datasette:
             await await_me_maybe(hook)
         self._startup_invoked = True
 
+    def _serializer(self, namespace):
+        # Serializers are reused for each namespace rather than created per call
+        serializer = self._serializers.get(namespace)
+        if serializer is None:
+            serializer = URLSafeSerializer(self._secret, namespace)
+            self._serializers[namespace] = serializer
+        return serializer
+
     def sign(self, value, namespace="default"):
-        return URLSafeSerializer(self._secret, namespace).dumps(value)
+        return self._serializer(namespace).dumps(value)
 
     def unsign(self, signed, namespace="default"):
-        return URLSafeSerializer(self._secret, namespace).loads(signed)
+        return self._serializer(namespace).loads(signed)
 
     def create_token(
         self,
@@ -596,31 +610,26 @@ class Datasette:
         token = {"a": actor_id, "t": int(time.time())}
         if expires_after:
             token["d"] = expires_after
-
-        def abbreviate_action(action):
-            # rename to abbr if possible
-            permission = self.permissions.get(action)
-            if not permission:
-                return action
-            return permission.abbr or action
-
-        if expires_after:
-            token["d"] = expires_after
-        if restrict_all or restrict_database or restrict_resource:
-            token["_r"] = {}
-            if restrict_all:
-                token["_r"]["a"] = [abbreviate_action(a) for a in restrict_all]
-            if restrict_database:
-                token["_r"]["d"] = {}
-                for database, actions in restrict_database.items():
-                    token["_r"]["d"][database] = [abbreviate_action(a) for a in actions]
-            if restrict_resource:
-                token["_r"]["r"] = {}
-                for database, resources in restrict_resource.items():
-                    for resource, actions in resources.items():
-                        token["_r"]["r"].setdefault(database, {})[resource] = [
-                            abbreviate_action(a) for a in actions
-                        ]
+        # Rename actions to their abbr where possible
+        abbrs = self._permission_abbrs
+        _r = {}
+        if restrict_all:
+            _r["a"] = [abbrs.get(a, a) for a in restrict_all]
+        if restrict_database:
+            _r["d"] = {
+                database: [abbrs.get(a, a) for a in actions]
+                for database, actions in restrict_database.items()
+            }
+        if restrict_resource:
+            _r["r"] = {
+                database: {
+                    resource: [abbrs.get(a, a) for a in actions]
+                    for resource, actions in resources.items()
+                }
+                for database, resources in restrict_resource.items()
+            }
+        if _r:
+            token["_r"] = _r
         return "dstok_{}".format(self.sign(token, namespace="token"))
 
     def get_database(self, name=None, route=None):
@@ -1,5 +1,7 @@
 from datasette import hookimpl, Permission
 from datasette.utils import actor_matches_allow
+import copy
+import hashlib
 import itsdangerous
 import time
 from typing import Union, Tuple
@@ -283,7 +285,7 @@ def restrictions_allow_action(
     if action == "view-instance":
         # Special case for view-instance: it's allowed if the restrictions include any
         # permissions that have the implies_can_view=True flag set
-        all_rules = restrictions.get("a") or []
+        all_rules = list(restrictions.get("a") or [])
         for database_rules in (restrictions.get("d") or {}).values():
             all_rules += database_rules
         for database_resource_rules in (restrictions.get("r") or {}).values():
@@ -296,7 +298,7 @@ def restrictions_allow_action(
     if action == "view-database":
         # Special case for view-database: it's allowed if the restrictions include any
         # permissions that have the implies_can_view=True flag set AND takes_database
-        all_rules = restrictions.get("a") or []
+        all_rules = list(restrictions.get("a") or [])
         database_rules = list((restrictions.get("d") or {}).get(resource) or [])
         all_rules += database_rules
         resource_rules = ((restrictions.get("r") or {}).get(resource) or {}).values()
@@ -363,21 +365,69 @@ def permission_allowed_actor_restrictions(datasette, actor, action, resource):
         return False
 
 
+# Signed API tokens are cached for a short time after they are checked, so
+# repeated requests using the same token can skip signature verification.
+# Rejected tokens are cached for much less time than verified ones.
+SIGNED_TOKEN_CACHE_SIZE = 4096
+SIGNED_TOKEN_CACHE_TTL = 30
+REJECTED_TOKEN_CACHE_SIZE = 2048
+REJECTED_TOKEN_CACHE_TTL = 5
+
+
 @hookimpl
 def actor_from_request(datasette, request):
     prefix = "dstok_"
+    authorization = _authorization_header(request)
+    if not authorization.startswith("Bearer " + prefix):
+        # Not a signed API token - reject before doing any other work
+        return None
+    token = authorization[len("Bearer ") :]
     if not datasette.setting("allow_signed_tokens"):
         return None
     max_signed_tokens_ttl = datasette.setting("max_signed_tokens_ttl")
-    authorization = request.headers.get("authorization")
-    if not authorization:
-        return None
-    if not authorization.startswith("Bearer "):
+    # Only a hash of the token is used as the cache key, never the token itself
+    cache_key = (
+        hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest(),
+        max_signed_tokens_ttl,
+    )
+    actor = _cache_get(datasette._signed_token_cache, cache_key, SIGNED_TOKEN_CACHE_TTL)
+    if actor is not None:
+        if "token_expires" in actor and time.time() > actor["token_expires"]:
+            # Expired since it was cached
+            return None
+        return _copy_actor(actor)
+    if _cache_get(datasette._rejected_token_cache, cache_key, REJECTED_TOKEN_CACHE_TTL):
         return None
-    token = authorization[len("Bearer ") :]
-    if not token.startswith(prefix):
+    actor = _actor_from_signed_token(
+        datasette, token[len(prefix) :], max_signed_tokens_ttl
+    )
+    if actor is None:
+        _cache_set(
+            datasette._rejected_token_cache,
+            cache_key,
+            True,
+            REJECTED_TOKEN_CACHE_SIZE,
+        )
         return None
-    token = token[len(prefix) :]
+    _cache_set(
+        datasette._signed_token_cache,
+        cache_key,
+        _copy_actor(actor),
+        SIGNED_TOKEN_CACHE_SIZE,
+    )
+    return actor
+
+
+def _authorization_header(request):
+    # Find just this header, rather than decoding all of them with request.headers
+    authorization = b""
+    for key, value in request.scope.get("headers") or []:
+        if key.lower() == b"authorization":
+            authorization = value
+    return authorization.decode("latin-1")
+
+
+def _actor_from_signed_token(datasette, token, max_signed_tokens_ttl):
     try:
         decoded = datasette.unsign(token, namespace="token")
     except itsdangerous.BadSignature:
@@ -411,6 +461,33 @@ def actor_from_request(datasette, request):
     return actor
 
 
+def _copy_actor(actor):
+    # Cached actors must not share restrictions with actors handed to callers
+    actor = dict(actor)
+    if "_r" in actor:
+        actor["_r"] = copy.deepcopy(actor["_r"])
+    return actor
+
+
+def _cache_get(cache, key, ttl):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    cached_at, value = entry
+    if time.monotonic() - cached_at > ttl:
+        cache.pop(key, None)
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def _cache_set(cache, key, value, maxsize):
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
 @hookimpl
 def skip_csrf(scope):
     # Skip CSRF check for requests with content-type: application/json
@@ -300,6 +300,75 @@ async def test_auth_with_dstok_token(ds_client, scenario, should_work):
         ds_client.ds._settings["allow_signed_tokens"] = True
 
 
+@pytest.mark.asyncio
+async def test_auth_dstok_token_verification_is_cached(ds_client, monkeypatch):
+    ds = ds_client.ds
+    token = "dstok_{}".format(
+        ds.sign({"a": "cached", "t": int(time.time()), "d": 1000}, "token")
+    )
+    unsign_calls = []
+    original_unsign = ds.unsign
+
+    def unsign(signed, namespace="default"):
+        if namespace == "token":
+            unsign_calls.append(signed)
+        return original_unsign(signed, namespace)
+
+    monkeypatch.setattr(ds, "unsign", unsign)
+    headers = {"Authorization": "Bearer {}".format(token)}
+    actors = []
+    for _ in range(3):
+        response = await ds_client.get("/-/actor.json", headers=headers)
+        actors.append(response.json()["actor"])
+    assert actors[0]["id"] == "cached"
+    assert actors[0] == actors[1] == actors[2]
+    assert len(unsign_calls) == 1
+    # Expiry is still enforced for cached tokens
+    monkeypatch.setattr(time, "time", lambda: actors[0]["token_expires"] + 1)
+    response = await ds_client.get("/-/actor.json", headers=headers)
+    assert response.json() == {"actor": None}
+
+
+@pytest.mark.asyncio
+async def test_auth_dstok_token_cached_restrictions_are_not_modified(ds_client):
+    token = ds_client.ds.create_token(
+        "restricted",
+        restrict_all=["view-instance"],
+        restrict_database={"fixtures": ["view-query"]},
+    )
+    headers = {"Authorization": "Bearer {}".format(token)}
+    expected_r = {"a": ["vi"], "d": {"fixtures": ["vq"]}}
+    actors = []
+    for _ in range(3):
+        # These pages run view-instance and view-database checks
+        for path in ("/", "/fixtures", "/fixtures/facetable"):
+            await ds_client.get(path, headers=headers)
+        response = await ds_client.get("/-/actor.json", headers=headers)
+        actors.append(response.json()["actor"])
+    assert actors[0]["_r"] == expected_r
+    assert actors[0] == actors[1] == actors[2]
+
+
+@pytest.mark.asyncio
+async def test_auth_dstok_token_rejection_is_cached(ds_client, monkeypatch):
+    ds = ds_client.ds
+    token = "dstok_{}".format(ds.sign({"a": "rejected"}, "token"))
+    unsign_calls = []
+    original_unsign = ds.unsign
+
+    def unsign(signed, namespace="default"):
+        if namespace == "token":
+            unsign_calls.append(signed)
+        return original_unsign(signed, namespace)
+
+    monkeypatch.setattr(ds, "unsign", unsign)
+    headers = {"Authorization": "Bearer {}".format(token)}
+    for _ in range(3):
+        response = await ds_client.get("/-/actor.json", headers=headers)
+        assert response.json() == {"actor": None}
+    assert len(unsign_calls) == 1
+
+
 @pytest.mark.parametrize("expires", (None, 1000, -1000))
 def test_cli_create_token(app_client, expires):
     secret = app_client.ds._secret
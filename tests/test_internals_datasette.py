@@ -2,6 +2,7 @@
 Tests for the datasette.app.Datasette class
 """
 
+import base64
 import dataclasses
 from datasette import Forbidden, Context
 from datasette.app import Datasette, Database
@@ -38,6 +39,17 @@ def test_sign_unsign(datasette, value, namespace):
         datasette.unsign(signed[:-1] + ("!" if signed[-1] != "!" else ":"))
 
 
+def test_create_token_payload_is_compact(datasette):
+    token = datasette.create_token(
+        "test", expires_after=60, restrict_all=["view-instance", "insert-row"]
+    )
+    payload = token[len("dstok_") :].split(".")[0]
+    decoded = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+    # No whitespace between separators, actions stored as abbreviations
+    assert b" " not in decoded
+    assert b'"_r":{"a":["vi","ir"]}' in decoded
+
+
 @pytest.mark.parametrize(
     "setting,expected",
     (